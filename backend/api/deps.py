@@ -1,12 +1,14 @@
 """Shared dependencies for API routes."""
 
-from functools import lru_cache
+from functools import cache
 
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     database_url: str = "postgresql+asyncpg://localhost:5432/quran_miracles"
+    db_pool_min: int = 8
+    db_pool_max: int = 16
     redis_url: str = "redis://localhost:6379"
     anthropic_api_key: str = ""
     openai_api_key: str = ""
@@ -17,6 +19,6 @@ class Settings(BaseSettings):
     model_config = {"env_file": ".env"}
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     return Settings()
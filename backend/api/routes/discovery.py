@@ -3,19 +3,43 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import uuid
-from typing import Literal
+from collections.abc import AsyncIterator, Iterator
+from functools import cache
+from typing import TYPE_CHECKING, Any, Literal
 
+import orjson
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from discovery_engine.core.graph import build_discovery_graph
-from discovery_engine.core.state import DiscoveryState
+if TYPE_CHECKING:
+    from discovery_engine.core.state import DiscoveryState
 
 router = APIRouter()
 
+# Frames buffered between the graph task and the SSE response
+_QUEUE_MAXSIZE = 64
+
+# Pre-encoded "event: …\ndata: " prefixes for the fixed set of SSE events
+_EVENT_PREFIX: dict[str, bytes] = {
+    name: f"event: {name}\ndata: ".encode()
+    for name in (
+        "session_start",
+        "route_query",
+        "quran_rag",
+        "linguistic",
+        "science",
+        "tafseer",
+        "humanities",
+        "synthesis",
+        "quality_review",
+        "kg_update",
+        "complete",
+        "error",
+    )
+}
+
 
 class DiscoveryRequest(BaseModel):
     """Request body for /api/discovery/stream."""
@@ -53,78 +77,23 @@ async def stream_discovery(request: DiscoveryRequest) -> StreamingResponse:
       8. quality_review — quality reviewed
       9. complete       — final results
     """
-    session_id = str(uuid.uuid4())
+    session_id = uuid.uuid4().hex
 
-    initial_state: DiscoveryState = {
-        "query": request.query,
-        "disciplines": request.disciplines,
-        "mode": request.mode,
-        "iteration_count": 0,
-        "streaming_updates": [],
-    }
+    initial_state = _initial_state(request)
 
-    async def event_generator():
+    async def event_generator() -> AsyncIterator[bytes]:
         # Send session start
         yield _sse_event("session_start", {"session_id": session_id})
 
+        # The graph runs in its own task so a slow client only stalls it
+        # once the queue is full, not on every frame.
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+        producer = asyncio.create_task(_produce(initial_state, session_id, queue))
         try:
-            graph = build_discovery_graph()
-            config = {"configurable": {"thread_id": session_id}}
-
-            # Track which stages we've sent
-            sent_stages: set[str] = set()
-
-            # Run graph with streaming if available
-            if hasattr(graph, "astream"):
-                async for chunk in graph.astream(initial_state, config=config):
-                    # Each chunk is a dict of node_name → partial state
-                    for _node_name, node_state in chunk.items():
-                        updates = node_state.get("streaming_updates", [])
-                        for update in updates:
-                            stage = update.get("stage", "")
-                            if stage and stage not in sent_stages:
-                                sent_stages.add(stage)
-                                yield _sse_event(stage, update)
-                                await asyncio.sleep(0.01)
-
-                # Get final state
-                final_state = await graph.aget_state(config)
-                state_values = (
-                    final_state.values
-                    if hasattr(final_state, "values")
-                    else final_state
-                )
-            else:
-                # Fallback: run ainvoke and send updates from result
-                state_values = await graph.ainvoke(initial_state, config=config)
-
-                for update in state_values.get("streaming_updates", []):
-                    stage = update.get("stage", "")
-                    if stage:
-                        yield _sse_event(stage, update)
-                        await asyncio.sleep(0.01)
-
-            # Send final result
-            yield _sse_event(
-                "complete",
-                {
-                    "session_id": session_id,
-                    "synthesis": state_values.get("synthesis", ""),
-                    "confidence_tier": state_values.get("confidence_tier", ""),
-                    "quality_score": state_values.get("quality_score", 0.0),
-                    "quality_issues": state_values.get("quality_issues", []),
-                    "verses_count": len(state_values.get("verses", [])),
-                    "science_findings_count": len(
-                        state_values.get("science_findings", [])
-                    ),
-                    "humanities_findings_count": len(
-                        state_values.get("humanities_findings", [])
-                    ),
-                },
-            )
-
-        except Exception as exc:
-            yield _sse_event("error", {"error": str(exc)})
+            while (frame := await queue.get()) is not None:
+                yield frame
+        finally:
+            producer.cancel()
 
     return StreamingResponse(
         event_generator(),
@@ -140,17 +109,11 @@ async def stream_discovery(request: DiscoveryRequest) -> StreamingResponse:
 @router.post("/explore")
 async def explore(request: DiscoveryRequest) -> DiscoveryResponse:
     """Non-streaming discovery exploration (returns full result)."""
-    session_id = str(uuid.uuid4())
+    session_id = uuid.uuid4().hex
 
-    initial_state: DiscoveryState = {
-        "query": request.query,
-        "disciplines": request.disciplines,
-        "mode": request.mode,
-        "iteration_count": 0,
-        "streaming_updates": [],
-    }
+    initial_state = _initial_state(request)
 
-    graph = build_discovery_graph()
+    graph = _get_graph()
     config = {"configurable": {"thread_id": session_id}}
     result = await graph.ainvoke(initial_state, config=config)
 
@@ -173,7 +136,130 @@ async def list_discoveries(tier: str | None = None) -> dict:
     return {"discoveries": [], "filter": tier}
 
 
-def _sse_event(event: str, data: dict) -> str:
-    """Format a Server-Sent Event."""
-    json_data = json.dumps(data, ensure_ascii=False)
-    return f"event: {event}\ndata: {json_data}\n\n"
+def _initial_state(request: DiscoveryRequest) -> DiscoveryState:
+    """Build the graph's starting state for a discovery request."""
+    # A fresh list per request — the reducer must never append to a shared one
+    return {
+        "query": request.query,
+        "disciplines": request.disciplines,
+        "mode": request.mode,
+        "iteration_count": 0,
+        "streaming_updates": [],
+    }
+
+
+async def _produce(
+    initial_state: DiscoveryState, session_id: str, queue: asyncio.Queue[bytes | None]
+) -> None:
+    """Run the graph and enqueue its SSE frames, ending with ``None``."""
+    try:
+        graph = _get_graph()
+        config = {"configurable": {"thread_id": session_id}}
+
+        # Run graph with streaming if available
+        stream = _stream_from_graph if _graph_streams() else _stream_from_fallback
+        async for frame in stream(graph, initial_state, config, session_id):
+            await queue.put(frame)
+
+    except Exception as exc:
+        await queue.put(_sse_event("error", {"error": str(exc)}))
+
+    await queue.put(None)
+
+
+@cache
+def _get_graph() -> Any:
+    """Compile the discovery graph once per process.
+
+    Compiled without a checkpointer: nothing resumes a session, and a
+    process-wide saver would keep every session's checkpoints forever.
+    The import is deferred so loading the API does not pull in every
+    agent module.
+    """
+    from discovery_engine.core.graph import build_discovery_graph
+
+    return build_discovery_graph(checkpointer=False)
+
+
+@cache
+def _graph_streams() -> bool:
+    """Whether the cached graph supports ``astream`` (probed once)."""
+    return hasattr(_get_graph(), "astream")
+
+
+async def _stream_from_graph(
+    graph: Any, initial_state: DiscoveryState, config: dict, session_id: str
+) -> AsyncIterator[bytes]:
+    """Stream stage events from ``graph.astream`` as each node finishes.
+
+    ``updates`` chunks drive the SSE stage frames; the final state is the
+    last ``values`` chunk, with LangGraph applying the state reducers
+    (the cached graph has no checkpointer to read it back from).
+    """
+    state_values: dict[str, Any] = dict(initial_state)
+    # Track which stages we've sent
+    sent_stages: set[str] = set()
+
+    async for mode, chunk in graph.astream(
+        initial_state, config=config, stream_mode=["updates", "values"]
+    ):
+        if mode == "values":
+            state_values = chunk
+            continue
+        # Each updates chunk is a dict of node_name → partial state
+        for _node_name, node_state in chunk.items():
+            updates = node_state.get("streaming_updates") if node_state else None
+            if not updates:
+                continue
+            for frame in _translate_updates(updates, sent_stages):
+                yield frame
+
+    yield _complete_event(session_id, state_values)
+
+
+async def _stream_from_fallback(
+    graph: Any, initial_state: DiscoveryState, config: dict, session_id: str
+) -> AsyncIterator[bytes]:
+    """Run ``graph.ainvoke`` and replay the recorded stage updates."""
+    state_values = await graph.ainvoke(initial_state, config=config)
+
+    sent_stages: set[str] = set()
+    for frame in _translate_updates(state_values.get("streaming_updates", []), sent_stages):
+        yield frame
+    yield _complete_event(session_id, state_values)
+
+
+def _translate_updates(updates: list[dict], sent_stages: set[str]) -> Iterator[bytes]:
+    """Turn node streaming updates into SSE frames, once per stage."""
+    for update in updates:
+        stage = update.get("stage", "")
+        if stage and stage not in sent_stages:
+            sent_stages.add(stage)
+            yield _sse_event(stage, update)
+
+
+def _complete_event(session_id: str, state_values: dict) -> bytes:
+    """Build the final ``complete`` frame from the graph's end state."""
+    return _sse_event(
+        "complete",
+        {
+            "session_id": session_id,
+            "synthesis": state_values.get("synthesis", ""),
+            "confidence_tier": state_values.get("confidence_tier", ""),
+            "quality_score": state_values.get("quality_score", 0.0),
+            "quality_issues": state_values.get("quality_issues", []),
+            "verses_count": len(state_values.get("verses", [])),
+            "science_findings_count": len(state_values.get("science_findings", [])),
+            "humanities_findings_count": len(state_values.get("humanities_findings", [])),
+        },
+    )
+
+
+def _sse_event(event: str, data: dict) -> bytes:
+    """Format a Server-Sent Event as UTF-8 bytes.
+
+    orjson emits UTF-8 directly (no ASCII escaping of Arabic text) and
+    handles UUID/datetime values natively.
+    """
+    prefix = _EVENT_PREFIX.get(event) or f"event: {event}\ndata: ".encode()
+    return prefix + orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
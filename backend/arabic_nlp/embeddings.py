@@ -3,6 +3,9 @@
 Provides async functions for computing 1536-dimensional embeddings
 for Quranic text. Embeddings are stored in pgvector columns.
 
+When ``REDIS_URL`` is set, single-text embeddings are cached in Redis
+keyed by a hash of the normalized text, so repeated queries skip the API.
+
 Usage:
     from arabic_nlp.embeddings import compute_embeddings, compute_embeddings_batch
 
@@ -12,17 +15,30 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
+from array import array
+from typing import Any
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, BadRequestError
 
 # ── Configuration ──────────────────────────────────────────────────────
 
 MODEL = "text-embedding-3-large"
 DIMENSIONS = 1536
 MAX_BATCH_SIZE = 2048  # OpenAI batch limit per request
+COALESCE_WINDOW = 0.005  # seconds to wait for concurrent single-text calls
+CACHE_TTL = 86_400  # seconds a cached query embedding stays in Redis
+CACHE_TIMEOUT = 0.25  # seconds before an unreachable Redis counts as a miss
 
 _client: AsyncOpenAI | None = None
+_redis: Any = None
+
+# Single-text requests waiting to be sent together in one batch call
+_pending: list[tuple[str, asyncio.Future[list[float]]]] = []
+_flush_handle: asyncio.TimerHandle | None = None
+_dispatch_tasks: set[asyncio.Task[None]] = set()
 
 
 def _get_client() -> AsyncOpenAI:
@@ -37,13 +53,32 @@ def _get_client() -> AsyncOpenAI:
     return _client
 
 
+def _get_redis() -> Any:
+    """Get or create the Redis client, or None when REDIS_URL is unset."""
+    global _redis  # noqa: PLW0603
+    if _redis is None:
+        url = os.environ.get("REDIS_URL")
+        if not url:
+            return None
+        from redis.asyncio import Redis
+
+        _redis = Redis.from_url(
+            url,
+            socket_connect_timeout=CACHE_TIMEOUT,
+            socket_timeout=CACHE_TIMEOUT,
+        )
+    return _redis
+
+
 # ── Public API ─────────────────────────────────────────────────────────
 
 
 async def compute_embeddings(text: str) -> list[float]:
     """Generate embedding for a single text string.
 
-    Uses OpenAI text-embedding-3-large (1536 dimensions).
+    Uses OpenAI text-embedding-3-large (1536 dimensions).  Results are
+    cached in Redis when configured; cache misses made concurrently within
+    ``COALESCE_WINDOW`` are sent as one batch request.
 
     Args:
         text: Arabic or multilingual text to embed.
@@ -51,14 +86,20 @@ async def compute_embeddings(text: str) -> list[float]:
     Returns:
         List of 1536 floats representing the embedding vector.
     """
-    client = _get_client()
-    response = await client.embeddings.create(
-        model=MODEL,
-        input=text,
-        dimensions=DIMENSIONS,
-    )
-    result: list[float] = response.data[0].embedding
-    return result
+    # Normalize once so the cache key and the embedded text always agree
+    text = text.strip()
+    cache = _get_redis()
+    key = _cache_key(text)
+    if cache is not None:
+        cached = await _cache_get(cache, key)
+        if cached is not None:
+            return cached
+
+    vector = await _coalesced(text)
+
+    if cache is not None:
+        await _cache_set(cache, key, vector)
+    return vector
 
 
 async def compute_embeddings_batch(
@@ -87,7 +128,107 @@ async def compute_embeddings_batch(
             input=batch,
             dimensions=DIMENSIONS,
         )
-        sorted_data = sorted(response.data, key=lambda x: x.index)
-        all_embeddings.extend([d.embedding for d in sorted_data])
+        # Place each result by its input index — one pass, no sort
+        ordered: list[list[float]] = [[] for _ in batch]
+        for d in response.data:
+            ordered[d.index] = d.embedding
+        all_embeddings.extend(ordered)
 
     return all_embeddings
+
+
+# ── Coalescing ─────────────────────────────────────────────────────────
+
+
+async def _coalesced(text: str) -> list[float]:
+    """Queue one text for the next batch request and await its vector."""
+    global _flush_handle  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[list[float]] = loop.create_future()
+    _pending.append((text, future))
+
+    if len(_pending) >= MAX_BATCH_SIZE:
+        _flush()
+    elif _flush_handle is None:
+        _flush_handle = loop.call_later(COALESCE_WINDOW, _flush)
+
+    return await future
+
+
+def _flush() -> None:
+    """Send all pending single-text requests as one batch."""
+    global _flush_handle  # noqa: PLW0603
+    if _flush_handle is not None:
+        _flush_handle.cancel()
+        _flush_handle = None
+
+    batch = _pending[:]
+    _pending.clear()
+    if batch:
+        task = asyncio.ensure_future(_dispatch(batch))
+        _dispatch_tasks.add(task)
+        task.add_done_callback(_dispatch_tasks.discard)
+
+
+async def _dispatch(batch: list[tuple[str, asyncio.Future[list[float]]]]) -> None:
+    """Embed a coalesced batch and resolve each caller's future."""
+    try:
+        vectors = await compute_embeddings_batch([text for text, _ in batch])
+    except BadRequestError as exc:
+        if len(batch) == 1:
+            _fail(batch, exc)
+            return
+        # One rejected input must not fail the unrelated callers batched
+        # with it: retry each text alone so only the offender gets the error.
+        # Only for 400s — splitting on rate limits or timeouts would multiply
+        # the load on an API that is already struggling.
+        await asyncio.gather(*(_dispatch([item]) for item in batch))
+        return
+    except Exception as exc:
+        _fail(batch, exc)
+        return
+
+    for (_, future), vector in zip(batch, vectors, strict=True):
+        if not future.done():
+            future.set_result(vector)
+
+
+def _fail(batch: list[tuple[str, asyncio.Future[list[float]]]], exc: Exception) -> None:
+    """Propagate a batch failure to every caller still waiting on it."""
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(exc)
+
+
+# ── Redis cache ────────────────────────────────────────────────────────
+
+
+def _cache_key(text: str) -> str:
+    """Cache key for a text under the current model and dimensions."""
+    digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    return f"emb:{MODEL}:{DIMENSIONS}:{digest}"
+
+
+async def _cache_get(cache: Any, key: str) -> list[float] | None:
+    """Read a cached vector; Redis errors are treated as a miss."""
+    from redis.exceptions import RedisError
+
+    try:
+        raw = await cache.get(key)
+    except RedisError:
+        return None
+    if not raw:
+        return None
+    vector = array("f")
+    vector.frombytes(raw)
+    return vector.tolist()
+
+
+async def _cache_set(cache: Any, key: str, vector: list[float]) -> None:
+    """Store a vector as packed float32; Redis errors are ignored."""
+    from redis.exceptions import RedisError
+
+    try:
+        await cache.setex(key, CACHE_TTL, array("f", vector).tobytes())
+    except RedisError:
+        pass
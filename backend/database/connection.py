@@ -6,7 +6,10 @@ Provides get_db() for FastAPI dependency injection.
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator
+from functools import cache
+from pathlib import Path
 from typing import Any
 
 import asyncpg
@@ -15,6 +18,7 @@ from pgvector.asyncpg import register_vector
 from api.deps import get_settings
 
 _pool: asyncpg.Pool | None = None
+_pool_lock = asyncio.Lock()
 
 
 def _get_dsn() -> str:
@@ -24,19 +28,40 @@ def _get_dsn() -> str:
     return url.replace("postgresql+asyncpg://", "postgresql://")
 
 
-async def init_pool(min_size: int = 5, max_size: int = 20) -> asyncpg.Pool:
-    """Initialize the asyncpg connection pool with pgvector support."""
+async def init_pool(
+    min_size: int | None = None, max_size: int | None = None
+) -> asyncpg.Pool:
+    """Initialize the asyncpg connection pool with pgvector support.
+
+    Sizes default to the DB_POOL_MIN / DB_POOL_MAX settings.
+    """
     global _pool  # noqa: PLW0603
     if _pool is not None:
         return _pool
 
-    _pool = await asyncpg.create_pool(
+    async with _pool_lock:
+        # The startup warm-up and a first request may race to get here.
+        if _pool is None:
+            settings = get_settings()
+            _pool = await _create_pool(
+                settings.db_pool_min if min_size is None else min_size,
+                settings.db_pool_max if max_size is None else max_size,
+            )
+    return _pool
+
+
+async def _create_pool(min_size: int, max_size: int) -> asyncpg.Pool:
+    return await asyncpg.create_pool(
         dsn=_get_dsn(),
         min_size=min_size,
         max_size=max_size,
+        statement_cache_size=1024,
+        max_inactive_connection_lifetime=0,
+        # JIT compilation only slows down the short OLTP queries we run.
+        server_settings={"jit": "off", "application_name": "quran_miracles"},
         init=_init_connection,
     )
-    return _pool
+
 
 async def _init_connection(conn: asyncpg.Connection) -> None:
     """Per-connection initialization: register pgvector type."""
@@ -73,15 +98,17 @@ async def get_db() -> AsyncIterator[Any]:
 
 async def apply_schema(schema_path: str | None = None) -> None:
     """Apply schema.sql to the database."""
-    import asyncio
-    from pathlib import Path
-
     if schema_path is None:
         schema_path = str(Path(__file__).parent / "schema.sql")
 
-    path = Path(schema_path)
-    sql = await asyncio.to_thread(path.read_text, encoding="utf-8")
+    sql = await asyncio.to_thread(_read_schema, schema_path)
 
     pool = await get_pool()
     async with pool.acquire() as conn:
         await conn.execute(sql)
+
+
+@cache
+def _read_schema(schema_path: str) -> str:
+    """Read a schema file once per process."""
+    return Path(schema_path).read_text(encoding="utf-8")
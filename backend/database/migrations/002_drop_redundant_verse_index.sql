@@ -0,0 +1,13 @@
+-- ══════════════════════════════════════════════════════════════════
+-- Migration 002: Drop idx_verses_surah
+-- فهرس UNIQUE(surah_number, verse_number) يغطي البحث بالسورة وحدها
+-- ══════════════════════════════════════════════════════════════════
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_verses_surah;
+
+INSERT INTO _migrations (name) VALUES ('002_drop_redundant_verse_index')
+ON CONFLICT (name) DO NOTHING;
+
+COMMIT;
@@ -1,9 +1,15 @@
 """SQLAlchemy models — Full schema defined in docs/05_database_schema.md."""
 
-import uuid
-from datetime import datetime
-
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, relationship
 
@@ -46,12 +52,14 @@ class Verse(Base):
 class Discovery(Base):
     __tablename__ = "discoveries"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(
+        UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid()
+    )
     title = Column(String(500), nullable=False)
     description = Column(Text, nullable=False)
     confidence_tier = Column(String(10), nullable=False, default="tier_0")
     evidence = Column(JSONB, default={})
     objections = Column(JSONB, default=[])
     is_published = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -107,9 +107,9 @@ CREATE TRIGGER trg_verses_search_vector
     FOR EACH ROW EXECUTE FUNCTION verses_search_vector_update();
 
 -- فهارس الأداء للآيات
+-- (surah_number, verse_number) يخدمها فهرس UNIQUE أعلاه، بما فيها البحث بالسورة وحدها
 CREATE INDEX idx_verses_search       ON verses USING GIN(search_vector);
 CREATE INDEX idx_verses_embedding    ON verses USING hnsw(embedding_precise vector_cosine_ops);
-CREATE INDEX idx_verses_surah        ON verses(surah_number);
 CREATE INDEX idx_verses_juz          ON verses(juz);
 
 -- ══════════════════════════════════════════
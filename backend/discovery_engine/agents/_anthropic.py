@@ -0,0 +1,45 @@
+"""Shared Anthropic client for the discovery agents.
+
+One ``AsyncAnthropic`` per process keeps its HTTP connection pool warm
+across agent calls instead of opening a fresh TLS connection each time.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+
+_client: AsyncAnthropic | None = None
+
+
+def get_client() -> AsyncAnthropic:
+    """Get or create the shared Anthropic async client.
+
+    Raises ImportError when the SDK is not installed, which the agents
+    treat like any other API failure and fall back to mock data.
+    """
+    global _client  # noqa: PLW0603
+    if _client is None:
+        from anthropic import AsyncAnthropic
+
+        _client = AsyncAnthropic()
+    return _client
+
+
+def cached_system(prompt: str) -> list[dict[str, Any]]:
+    """Wrap a static system prompt as a prompt-cached system block.
+
+    The prefix is identical across calls, so the API can serve it from its
+    ephemeral cache once it reaches the model's minimum cacheable length.
+    """
+    return [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
+
+
+async def close_client() -> None:
+    """Close the shared client's connection pool."""
+    global _client  # noqa: PLW0603
+    if _client is not None:
+        await _client.close()
+        _client = None
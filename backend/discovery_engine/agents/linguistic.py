@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import importlib.util
 import json
+from functools import cache
+from typing import Any
 
+from discovery_engine.agents._anthropic import get_client
 from discovery_engine.core.state import DiscoveryState
 
 _MODEL = "claude-sonnet-4-5-20250514"
 _TEMPERATURE = 0.3
 
+# Probed once at import; the analyzer itself is built on first use
+_CAMEL_AVAILABLE = importlib.util.find_spec("camel_tools") is not None
+
 
 class LinguisticAnalysisAgent:
     """Deep linguistic analysis of Quranic text.
@@ -25,52 +32,46 @@ class LinguisticAnalysisAgent:
             return {"roots": [], "morphology": {}, "rhetorical_devices": []}
 
         # Try CAMeL Tools first
-        camel_available = self._check_camel()
-        if camel_available:
+        if _CAMEL_AVAILABLE:
             return self._analyze_with_camel(verses)
 
         # Fall back to Claude API
         return await self._analyze_with_llm(verses, state)
 
-    def _check_camel(self) -> bool:
-        """Check if CAMeL Tools is installed."""
-        try:
-            import camel_tools  # noqa: F401
-            return True
-        except ImportError:
-            return False
-
     def _analyze_with_camel(self, verses: list[dict]) -> dict:  # pragma: no cover
         """Use CAMeL Tools for morphological analysis."""
-        from camel_tools.morphology.analyzer import Analyzer
-
-        analyzer = Analyzer.builtin_analyzer()
-        all_roots: list[str] = []
+        analyzer = _get_analyzer()
+        # Dict as an ordered set: roots keep first-seen order
+        all_roots: dict[str, None] = {}
         morphology: dict[str, list] = {}
         rhetorical: list[dict] = []
+        # Particles like و / في / من recur constantly; analyze each word once
+        best_by_word: dict[str, dict | None] = {}
 
         for v in verses:
             text = v.get("text_clean") or v.get("text_simple", "")
-            words = text.split()
             verse_morph = []
-            for word in words:
-                analyses = analyzer.analyze(word)
-                if analyses:
-                    best = analyses[0]
-                    root = best.get("root", "")
-                    if root and root not in all_roots:
-                        all_roots.append(root)
-                    verse_morph.append({
-                        "word": word,
-                        "root": root,
-                        "lemma": best.get("lex", ""),
-                        "pos": best.get("pos", ""),
-                        "pattern": best.get("form", ""),
-                    })
+            for word in text.split():
+                if word not in best_by_word:
+                    analyses = analyzer.analyze(word)
+                    best_by_word[word] = analyses[0] if analyses else None
+                best = best_by_word[word]
+                if best is None:
+                    continue
+                root = best.get("root", "")
+                if root:
+                    all_roots[root] = None
+                verse_morph.append({
+                    "word": word,
+                    "root": root,
+                    "lemma": best.get("lex", ""),
+                    "pos": best.get("pos", ""),
+                    "pattern": best.get("form", ""),
+                })
             morphology[v.get("verse_key", "")] = verse_morph
 
         return {
-            "roots": all_roots,
+            "roots": list(all_roots),
             "morphology": morphology,
             "rhetorical_devices": rhetorical,
         }
@@ -95,9 +96,7 @@ class LinguisticAnalysisAgent:
         )
 
         try:
-            from anthropic import AsyncAnthropic
-
-            client = AsyncAnthropic()
+            client = get_client()
             resp = await client.messages.create(
                 model=_MODEL,
                 max_tokens=2048,
@@ -138,6 +137,14 @@ class LinguisticAnalysisAgent:
         }
 
 
+@cache
+def _get_analyzer() -> Any:  # pragma: no cover
+    """Build the CAMeL analyzer once; loading its morphology DB is slow."""
+    from camel_tools.morphology.analyzer import Analyzer
+
+    return Analyzer.builtin_analyzer()
+
+
 def _parse_json(text: str) -> dict:
     text = text.strip()
     if text.startswith("```"):
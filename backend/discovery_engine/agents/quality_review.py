@@ -4,11 +4,15 @@ from __future__ import annotations
 
 import json
 
+from discovery_engine.agents._anthropic import get_client
 from discovery_engine.core.state import DiscoveryState
 
 _MODEL = "claude-sonnet-4-5-20250514"
 _TEMPERATURE = 0.3
 
+_VALID_TIERS = frozenset({"tier_1", "tier_2", "tier_3"})
+_VALID_CORRELATION_TYPES = frozenset({"intersecting", "parallel", "inspirational"})
+
 
 class QualityReviewAgent:
     """Reviews discovery results for academic rigor.
@@ -65,7 +69,7 @@ class QualityReviewAgent:
                     f"ارتباط علمي بدون اعتراض رئيسي: {vk}"
                 )
             tier = finding.get("confidence_tier", "")
-            if tier not in ("tier_1", "tier_2", "tier_3"):
+            if tier not in _VALID_TIERS:
                 issues.append(
                     f"مستوى ثقة غير صالح: {tier}"
                 )
@@ -78,7 +82,7 @@ class QualityReviewAgent:
                     f"ارتباط إنساني بدون ملاحظة أمانة علمية: {vk}"
                 )
             ctype = finding.get("correlation_type", "")
-            if ctype not in ("intersecting", "parallel", "inspirational"):
+            if ctype not in _VALID_CORRELATION_TYPES:
                 issues.append(
                     f"نوع ارتباط غير صالح: {ctype}"
                 )
@@ -135,9 +139,7 @@ class QualityReviewAgent:
         )
 
         try:
-            from anthropic import AsyncAnthropic
-
-            client = AsyncAnthropic()
+            client = get_client()
             resp = await client.messages.create(
                 model=_MODEL,
                 max_tokens=1024,
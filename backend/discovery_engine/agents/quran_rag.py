@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 from typing import Any
 
+import orjson
+
+from discovery_engine.agents._anthropic import cached_system, get_client
 from discovery_engine.core.state import DiscoveryState
 from discovery_engine.prompts.system_prompts import QURAN_SCHOLAR_SYSTEM_PROMPT
 
@@ -22,11 +26,26 @@ class QuranRAGAgent:
     with explicit mock-data annotation.
     """
 
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Future[dict]] = {}
+
     async def search(self, query: str, state: DiscoveryState) -> dict:
         """Search for relevant verses and tafseer context.
 
         Returns dict with ``verses`` and ``tafseer_context`` keys.
         """
+        # Single-flight: concurrent searches for the same query share one
+        # embedding + DB (or LLM) round trip.  Shielded so a disconnecting
+        # caller does not cancel the search for the others.
+        key = query.strip()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._search(query, state))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _search(self, query: str, state: DiscoveryState) -> dict:
         db_available = os.environ.get("DATABASE_URL") and not os.environ.get(
             "_MOCK_DB"
         )
@@ -41,81 +60,75 @@ class QuranRAGAgent:
         self, query: str, state: DiscoveryState
     ) -> dict:  # pragma: no cover
         """Search PostgreSQL with pgvector similarity."""
-        import asyncpg
-        from pgvector.asyncpg import register_vector
-
         from arabic_nlp.embeddings import compute_embeddings
+        from database.connection import get_pool
 
-        database_url = os.environ["DATABASE_URL"]
-        conn = await asyncpg.connect(database_url)
-        await register_vector(conn)
-
-        try:
-            embedding = await compute_embeddings(query)
+        # Embed before acquiring so the API call does not hold a connection
+        embedding = await compute_embeddings(query)
 
+        # Shared pool: connections arrive warm with pgvector registered
+        pool = await get_pool()
+        async with pool.acquire() as conn:
+            # Nearest verses with their tafseers aggregated per verse in SQL:
+            # one round trip, one row per hit.
             rows = await conn.fetch(
                 """
-                SELECT surah_number, verse_number, text_uthmani,
-                       text_simple, text_clean,
-                       1 - (embedding_precise <=> $1::vector) AS similarity
-                FROM verses
-                WHERE embedding_precise IS NOT NULL
-                ORDER BY embedding_precise <=> $1::vector
-                LIMIT 10
+                SELECT v.surah_number, v.verse_number, v.text_uthmani,
+                       v.text_simple, v.text_clean,
+                       1 - v.distance AS similarity,
+                       COALESCE(t.tafseers, '[]') AS tafseers
+                FROM (
+                    SELECT id, surah_number, verse_number, text_uthmani,
+                           text_simple, text_clean,
+                           embedding_precise <=> $1::vector AS distance
+                    FROM verses
+                    WHERE embedding_precise IS NOT NULL
+                    ORDER BY embedding_precise <=> $1::vector
+                    LIMIT 10
+                ) v
+                LEFT JOIN LATERAL (
+                    SELECT json_agg(
+                               json_build_object(
+                                   'slug', tb.slug, 'name', tb.name_ar,
+                                   'text', t.text
+                               )
+                               ORDER BY tb.priority_order
+                           ) AS tafseers
+                    FROM tafseers t
+                    JOIN tafseer_books tb ON tb.id = t.book_id
+                    WHERE t.verse_id = v.id
+                ) t ON true
+                ORDER BY v.distance
                 """,
                 embedding,
             )
 
-            verses: list[dict[str, Any]] = []
-            for r in rows:
-                verse_id_row = await conn.fetchrow(
-                    "SELECT id FROM verses WHERE surah_number=$1 AND verse_number=$2",
-                    r["surah_number"],
-                    r["verse_number"],
-                )
-                vid = verse_id_row["id"] if verse_id_row else None
-
-                tafseer_rows = await conn.fetch(
-                    """
-                    SELECT tb.slug, tb.name_ar, t.text
-                    FROM tafseers t
-                    JOIN tafseer_books tb ON tb.id = t.book_id
-                    WHERE t.verse_id = $1
-                    ORDER BY tb.priority_order
-                    """,
-                    vid,
-                ) if vid else []
-
-                verses.append({
+            verses: list[dict[str, Any]] = [
+                {
                     "surah_number": r["surah_number"],
                     "verse_number": r["verse_number"],
                     "verse_key": f"{r['surah_number']}:{r['verse_number']}",
                     "text_uthmani": r["text_uthmani"],
                     "text_simple": r["text_simple"],
                     "similarity": float(r["similarity"]),
-                    "tafseers": [
-                        {"slug": t["slug"], "name": t["name_ar"], "text": t["text"]}
-                        for t in tafseer_rows
-                    ],
-                })
+                    "tafseers": orjson.loads(r["tafseers"]),
+                }
+                for r in rows
+            ]
 
             return {"verses": verses, "tafseer_context": _summarise(verses)}
-        finally:
-            await conn.close()
 
     # ── LLM fallback (no DB) ──────────────────────────────
 
     async def _search_llm(self, query: str, state: DiscoveryState) -> dict:
         """Use Claude to find relevant verses (mock / no-DB mode)."""
         try:
-            from anthropic import AsyncAnthropic
-
-            client = AsyncAnthropic()
+            client = get_client()
             resp = await client.messages.create(
                 model=_MODEL,
                 max_tokens=2048,
                 temperature=_TEMPERATURE,
-                system=QURAN_SCHOLAR_SYSTEM_PROMPT,
+                system=cached_system(QURAN_SCHOLAR_SYSTEM_PROMPT),
                 messages=[
                     {
                         "role": "user",
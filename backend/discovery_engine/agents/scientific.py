@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 
+from discovery_engine.agents._anthropic import cached_system, get_client
 from discovery_engine.prompts.system_prompts import SCIENCE_EXPLORER_SYSTEM_PROMPT
 
 _MODEL = "claude-sonnet-4-5-20250514"
@@ -56,14 +57,12 @@ class ScientificExplorerAgent:
         )
 
         try:
-            from anthropic import AsyncAnthropic
-
-            client = AsyncAnthropic()
+            client = get_client()
             resp = await client.messages.create(
                 model=_MODEL,
                 max_tokens=2048,
                 temperature=_TEMPERATURE,
-                system=SCIENCE_EXPLORER_SYSTEM_PROMPT,
+                system=cached_system(SCIENCE_EXPLORER_SYSTEM_PROMPT),
                 messages=[{"role": "user", "content": prompt}],
             )
             return _parse_findings(resp.content[0].text)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from discovery_engine.agents._anthropic import cached_system, get_client
 from discovery_engine.core.state import DiscoveryState
 from discovery_engine.prompts.system_prompts import SYNTHESIS_SYSTEM_PROMPT
 
@@ -40,14 +41,12 @@ class SynthesisAgent:
         prompt = self._build_prompt(all_findings, state)
 
         try:
-            from anthropic import AsyncAnthropic
-
-            client = AsyncAnthropic()
+            client = get_client()
             resp = await client.messages.create(
                 model=_MODEL,
                 max_tokens=4096,
                 temperature=_TEMPERATURE,
-                system=SYNTHESIS_SYSTEM_PROMPT,
+                system=cached_system(SYNTHESIS_SYSTEM_PROMPT),
                 messages=[{"role": "user", "content": prompt}],
             )
             result: str = resp.content[0].text
@@ -67,14 +66,12 @@ class SynthesisAgent:
         prompt = self._build_prompt(all_findings, state)
 
         try:
-            from anthropic import AsyncAnthropic
-
-            client = AsyncAnthropic()
+            client = get_client()
             async with client.messages.stream(
                 model=_MODEL,
                 max_tokens=4096,
                 temperature=_TEMPERATURE,
-                system=SYNTHESIS_SYSTEM_PROMPT,
+                system=cached_system(SYNTHESIS_SYSTEM_PROMPT),
                 messages=[{"role": "user", "content": prompt}],
             ) as stream:
                 async for text in stream.text_stream:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 
+from discovery_engine.agents._anthropic import cached_system, get_client
 from discovery_engine.core.state import DiscoveryState
 from discovery_engine.prompts.system_prompts import QURAN_SCHOLAR_SYSTEM_PROMPT
 
@@ -114,14 +115,12 @@ class TafseerAgent:
         )
 
         try:
-            from anthropic import AsyncAnthropic
-
-            client = AsyncAnthropic()
+            client = get_client()
             resp = await client.messages.create(
                 model=_MODEL,
                 max_tokens=3000,
                 temperature=_TEMPERATURE,
-                system=QURAN_SCHOLAR_SYSTEM_PROMPT,
+                system=cached_system(QURAN_SCHOLAR_SYSTEM_PROMPT),
                 messages=[{"role": "user", "content": prompt}],
             )
             return _parse_json(resp.content[0].text)
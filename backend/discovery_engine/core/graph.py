@@ -1,13 +1,17 @@
 """LangGraph workflow definition for the discovery engine.
 
 Flow:
-  route_query → quran_rag → linguistic ─┬→ science
-                                         ├→ tafseer
-                                         └→ humanities
-                                           ↓
-                                        synthesis → quality_review
-                                           ↓
-                            [Conditional: deepen_search or kg_update]
+  route_query → quran_rag ─┬→ linguistic
+                           ├→ science
+                           ├→ tafseer
+                           └→ humanities
+                                ↓
+                           synthesis → quality_review
+                                ↓
+               [Conditional: deepen_search or kg_update]
+
+The four analysis branches only depend on the retrieved verses, so
+they run concurrently in a single LangGraph superstep.
 """
 
 from __future__ import annotations
@@ -27,6 +31,18 @@ from discovery_engine.core.state import DiscoveryState
 # Maximum iterations for the deepen loop
 _MAX_ITERATIONS = 3
 
+# Independent analysis nodes fanned out after retrieval
+_PARALLEL_BRANCHES = ("linguistic", "science", "tafseer", "humanities")
+
+# Agents are stateless, so one instance of each serves every session
+_QURAN_RAG = QuranRAGAgent()
+_LINGUISTIC = LinguisticAnalysisAgent()
+_SCIENTIFIC = ScientificExplorerAgent()
+_TAFSEER = TafseerAgent()
+_HUMANITIES = HumanitiesAgent()
+_SYNTHESIS = SynthesisAgent()
+_QUALITY_REVIEW = QualityReviewAgent()
+
 
 # ── Node functions ─────────────────────────────────────────
 
@@ -40,37 +56,32 @@ async def route_query(state: DiscoveryState) -> DiscoveryState:
         updates["mode"] = "guided"
     if not state.get("iteration_count"):
         updates["iteration_count"] = 0
-    updates["streaming_updates"] = state.get("streaming_updates", []) + [
-        {"stage": "route_query", "status": "done"}
-    ]
+    updates["streaming_updates"] = [{"stage": "route_query", "status": "done"}]
     return updates
 
 
 async def quran_rag_node(state: DiscoveryState) -> DiscoveryState:
     """Retrieve Quranic context using RAG."""
-    agent = QuranRAGAgent()
-    result = await agent.search(state.get("query", ""), state)
+    result = await _QURAN_RAG.search(state.get("query", ""), state)
     return {
         "verses": result.get("verses", []),
-        "streaming_updates": state.get("streaming_updates", [])
-        + [{"stage": "quran_rag", "status": "done", "verse_count": len(result.get("verses", []))}],
+        "streaming_updates": [
+            {"stage": "quran_rag", "status": "done", "verse_count": len(result.get("verses", []))}
+        ],
     }
 
 
 async def linguistic_node(state: DiscoveryState) -> DiscoveryState:
     """Perform morphological and rhetorical analysis."""
-    agent = LinguisticAnalysisAgent()
-    result = await agent.analyze(state.get("verses", []), state)
+    result = await _LINGUISTIC.analyze(state.get("verses", []), state)
     return {
         "linguistic_analysis": result,
-        "streaming_updates": state.get("streaming_updates", [])
-        + [{"stage": "linguistic", "status": "done"}],
+        "streaming_updates": [{"stage": "linguistic", "status": "done"}],
     }
 
 
 async def science_node(state: DiscoveryState) -> DiscoveryState:
     """Find scientific correlations across disciplines."""
-    agent = ScientificExplorerAgent()
     disciplines = state.get("disciplines", ["physics", "biology"])
     context = {
         "verses": state.get("verses", []),
@@ -79,7 +90,7 @@ async def science_node(state: DiscoveryState) -> DiscoveryState:
 
     all_findings: list[dict] = []
     tasks = [
-        agent.explore(state.get("query", ""), d, context)
+        _SCIENTIFIC.explore(state.get("query", ""), d, context)
         for d in disciplines
     ]
     results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -89,43 +100,41 @@ async def science_node(state: DiscoveryState) -> DiscoveryState:
 
     return {
         "science_findings": all_findings,
-        "streaming_updates": state.get("streaming_updates", [])
-        + [{"stage": "science", "status": "done", "finding_count": len(all_findings)}],
+        "streaming_updates": [
+            {"stage": "science", "status": "done", "finding_count": len(all_findings)}
+        ],
     }
 
 
 async def tafseer_node(state: DiscoveryState) -> DiscoveryState:
     """Gather tafseer insights from 7 references."""
-    agent = TafseerAgent()
-    result = await agent.analyze(state.get("verses", []), state)
+    result = await _TAFSEER.analyze(state.get("verses", []), state)
     return {
         "tafseer_findings": result,
-        "streaming_updates": state.get("streaming_updates", [])
-        + [{"stage": "tafseer", "status": "done"}],
+        "streaming_updates": [{"stage": "tafseer", "status": "done"}],
     }
 
 
 async def humanities_node(state: DiscoveryState) -> DiscoveryState:
     """Analyze humanities connections."""
-    agent = HumanitiesAgent()
     context = {
         "verses": state.get("verses", []),
         "tafseer_context": "",
     }
     disciplines = state.get("disciplines", ["psychology", "sociology"])
-    result = await agent.analyze(
+    result = await _HUMANITIES.analyze(
         state.get("verses", []), context, disciplines
     )
     return {
         "humanities_findings": result,
-        "streaming_updates": state.get("streaming_updates", [])
-        + [{"stage": "humanities", "status": "done", "finding_count": len(result)}],
+        "streaming_updates": [
+            {"stage": "humanities", "status": "done", "finding_count": len(result)}
+        ],
     }
 
 
 async def synthesis_node(state: DiscoveryState) -> DiscoveryState:
     """Synthesize findings from all agents."""
-    agent = SynthesisAgent()
     all_findings = {
         "verses": state.get("verses", []),
         "linguistic_analysis": state.get("linguistic_analysis", {}),
@@ -133,7 +142,7 @@ async def synthesis_node(state: DiscoveryState) -> DiscoveryState:
         "tafseer_findings": state.get("tafseer_findings", {}),
         "humanities_findings": state.get("humanities_findings", []),
     }
-    result = await agent.synthesize(all_findings, state)
+    result = await _SYNTHESIS.synthesize(all_findings, state)
 
     # Extract confidence_tier from synthesis text
     tier = "tier_2"  # default
@@ -145,23 +154,20 @@ async def synthesis_node(state: DiscoveryState) -> DiscoveryState:
     return {
         "synthesis": result,
         "confidence_tier": tier,
-        "streaming_updates": state.get("streaming_updates", [])
-        + [{"stage": "synthesis", "status": "done"}],
+        "streaming_updates": [{"stage": "synthesis", "status": "done"}],
     }
 
 
 async def quality_review_node(state: DiscoveryState) -> DiscoveryState:
     """Review quality and decide whether to deepen."""
-    agent = QualityReviewAgent()
-    result = await agent.review(state)
+    result = await _QUALITY_REVIEW.review(state)
     iteration = state.get("iteration_count", 0) + 1
     return {
         "quality_score": result["quality_score"],
         "quality_issues": result["quality_issues"],
         "should_deepen": result["should_deepen"] and iteration < _MAX_ITERATIONS,
         "iteration_count": iteration,
-        "streaming_updates": state.get("streaming_updates", [])
-        + [
+        "streaming_updates": [
             {
                 "stage": "quality_review",
                 "status": "done",
@@ -175,8 +181,7 @@ async def quality_review_node(state: DiscoveryState) -> DiscoveryState:
 async def kg_update_node(state: DiscoveryState) -> DiscoveryState:
     """Update knowledge graph (placeholder for Neo4j integration)."""
     return {
-        "streaming_updates": state.get("streaming_updates", [])
-        + [{"stage": "kg_update", "status": "done"}],
+        "streaming_updates": [{"stage": "kg_update", "status": "done"}],
     }
 
 
@@ -190,10 +195,12 @@ def should_deepen(state: DiscoveryState) -> str:
 # ── Graph builder ──────────────────────────────────────────
 
 
-def build_discovery_graph():
+def build_discovery_graph(*, checkpointer: bool = True):
     """Build and compile the LangGraph StateGraph.
 
-    Returns a compiled graph with MemorySaver checkpointer.
+    Returns a compiled graph with a MemorySaver checkpointer, or without
+    one when ``checkpointer`` is False — a long-lived graph shared across
+    requests must not accumulate every session's checkpoints in memory.
     """
     try:
         from langgraph.checkpoint.memory import MemorySaver
@@ -220,17 +227,13 @@ def build_discovery_graph():
 
     # Sequential edges
     graph.add_edge("route_query", "quran_rag")
-    graph.add_edge("quran_rag", "linguistic")
 
-    # Parallel edges: after linguistic → science, tafseer, humanities
-    graph.add_edge("linguistic", "science")
-    graph.add_edge("linguistic", "tafseer")
-    graph.add_edge("linguistic", "humanities")
+    # Parallel edges: after quran_rag → linguistic, science, tafseer, humanities
+    for branch in _PARALLEL_BRANCHES:
+        graph.add_edge("quran_rag", branch)
 
-    # All three converge to synthesis
-    graph.add_edge("science", "synthesis")
-    graph.add_edge("tafseer", "synthesis")
-    graph.add_edge("humanities", "synthesis")
+    # All four converge to synthesis
+    graph.add_edge(list(_PARALLEL_BRANCHES), "synthesis")
 
     # synthesis → quality_review
     graph.add_edge("synthesis", "quality_review")
@@ -249,47 +252,47 @@ def build_discovery_graph():
     graph.add_edge("kg_update", END)
 
     # Compile with checkpointer
-    checkpointer = MemorySaver()
-    return graph.compile(checkpointer=checkpointer)
+    return graph.compile(checkpointer=MemorySaver() if checkpointer else None)
 
 
 class _FallbackGraph:
     """Simple fallback when LangGraph is not installed.
 
-    Runs nodes sequentially to allow testing without langgraph dependency.
+    Runs nodes in the same order as the compiled graph (with the four
+    analysis branches gathered concurrently) to allow testing without
+    langgraph dependency.
     """
 
     async def ainvoke(
         self, state: DiscoveryState, config: dict | None = None
     ) -> DiscoveryState:
-        """Run all nodes sequentially."""
+        """Run all nodes once, without the deepen loop."""
         result: dict[str, Any] = dict(state)
 
-        for node_fn in (route_query, quran_rag_node, linguistic_node):
-            updates = await node_fn(result)  # type: ignore[arg-type]
-            result.update(updates)
+        for node_fn in (route_query, quran_rag_node):
+            _merge(result, await node_fn(result))  # type: ignore[arg-type]
 
-        # parallel: science, tafseer, humanities
-        _state = cast(DiscoveryState, result)
-        sci, taf, hum = await asyncio.gather(
+        # parallel: linguistic, science, tafseer, humanities
+        _state = cast(DiscoveryState, dict(result))
+        partials = await asyncio.gather(
+            linguistic_node(_state),
             science_node(_state),
             tafseer_node(_state),
             humanities_node(_state),
         )
-        # Merge results carefully — concatenate streaming_updates
-        base_updates = list(result.get("streaming_updates", []))
-        for partial in (sci, taf, hum):
-            for key, val in partial.items():
-                if key == "streaming_updates" and isinstance(val, list):
-                    for u in val:
-                        if u not in base_updates:
-                            base_updates.append(u)
-                else:
-                    result[key] = val
-        result["streaming_updates"] = base_updates
+        for partial in partials:
+            _merge(result, partial)
 
         for node_fn in (synthesis_node, quality_review_node, kg_update_node):
-            updates = await node_fn(result)  # type: ignore[arg-type]
-            result.update(updates)
+            _merge(result, await node_fn(result))  # type: ignore[arg-type]
 
         return cast(DiscoveryState, result)
+
+
+def _merge(result: dict[str, Any], updates: DiscoveryState) -> None:
+    """Apply a node's partial update, mirroring the state reducers."""
+    for key, val in updates.items():
+        if key == "streaming_updates":
+            result[key] = [*result.get(key, []), *cast(list, val)]
+        else:
+            result[key] = val
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Literal, TypedDict
+import operator
+from typing import Annotated, Literal, TypedDict
 
 
 class DiscoveryState(TypedDict, total=False):
@@ -37,7 +38,9 @@ class DiscoveryState(TypedDict, total=False):
     iteration_count: int
 
     # ── Streaming ──────────────────────────────────────────
-    streaming_updates: list[dict]
+    # Reducer-annotated so parallel branches can append concurrently:
+    # nodes return only their own updates and LangGraph concatenates.
+    streaming_updates: Annotated[list[dict], operator.add]
 
     # ── Error handling ─────────────────────────────────────
     error: str | None
@@ -1,19 +1,46 @@
 """معجزات القرآن الكريم — FastAPI Application Entry Point."""
 
+import asyncio
+import logging
+import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from api.routes import discovery, prediction, quran
+from database.connection import close_pool, init_pool
+from discovery_engine.agents._anthropic import close_client
+
+logger = logging.getLogger(__name__)
+
+
+def _report_warm_up(task: asyncio.Task) -> None:
+    """Log a failed pool warm-up so a bad DATABASE_URL shows at startup."""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.warning("Database pool warm-up failed: %r", exc)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    # Startup
+    # Startup: open the pool's min_size connections in the background so
+    # the first request doesn't pay the connect latency.  If it fails, the
+    # first request retries through get_pool().
+    warm_up = None
+    if os.environ.get("DATABASE_URL"):
+        warm_up = asyncio.create_task(init_pool())
+        warm_up.add_done_callback(_report_warm_up)
     yield
     # Shutdown
+    if warm_up is not None:
+        warm_up.cancel()
+    await close_pool()
+    await close_client()
 
 
 app = FastAPI(
@@ -21,6 +48,7 @@ app = FastAPI(
     description="AI Discovery Platform for Quranic Miracles",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -14,7 +14,11 @@ from pathlib import Path
 import asyncpg
 
 
-async def apply_schema(max_retries: int = 5, base_delay: float = 2.0) -> None:
+async def apply_schema(
+    max_retries: int = 15,
+    base_delay: float = 0.5,
+    max_delay: float = 5.0,
+) -> None:
     database_url = os.environ.get(
         "DATABASE_URL",
         "postgresql://localhost:5432/quran_miracles",
@@ -28,15 +32,19 @@ async def apply_schema(max_retries: int = 5, base_delay: float = 2.0) -> None:
         try:
             conn = await asyncio.wait_for(
                 asyncpg.connect(database_url),
-                timeout=10,
+                timeout=2,
             )
             break
         except Exception as exc:
             if attempt == max_retries:
                 print(f"Failed to connect after {max_retries} attempts: {exc}")
                 sys.exit(1)
-            delay = base_delay * (2 ** (attempt - 1))
-            print(f"Connection attempt {attempt} failed: {exc}. Retrying in {delay}s...")
+            # Poll quickly while PostgreSQL is likely just starting up
+            delay = min(base_delay * 1.3 ** (attempt - 1), max_delay)
+            print(
+                f"Connection attempt {attempt} failed: {exc}. "
+                f"Retrying in {delay:.1f}s..."
+            )
             await asyncio.sleep(delay)
 
     assert conn is not None
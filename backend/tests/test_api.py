@@ -43,3 +43,20 @@ async def test_list_surahs(client):
 async def test_list_discoveries(client):
     response = await client.get("/api/discovery/discoveries")
     assert response.status_code == 200
+
+
+def test_sse_event_format():
+    from api.routes.discovery import _sse_event
+
+    frame = _sse_event("quran_rag", {"query": "الماء", "count": 3})
+    assert isinstance(frame, bytes)
+    assert frame.startswith(b"event: quran_rag\ndata: ")
+    assert frame.endswith(b"\n\n")
+    # Arabic text is emitted as raw UTF-8, not \u-escaped
+    assert "الماء".encode() in frame
+
+
+def test_sse_event_unknown_name():
+    from api.routes.discovery import _sse_event
+
+    assert _sse_event("custom", {}) == b"event: custom\ndata: {}\n\n"
@@ -6,6 +6,7 @@ Disciplines: ["physics", "biology", "psychology"]
 All tests run without external APIs — agents fall back to mock data.
 """
 
+import asyncio
 import importlib.util
 
 import pytest
@@ -52,6 +53,28 @@ async def test_quran_rag_agent():
     assert "21:30" in verse_keys
 
 
+@pytest.mark.asyncio
+async def test_quran_rag_coalesces_concurrent_searches(monkeypatch):
+    agent = QuranRAGAgent()
+    calls = 0
+
+    async def _fake_search(query, state):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return {"verses": [], "tafseer_context": query}
+
+    monkeypatch.setattr(agent, "_search", _fake_search)
+    state: DiscoveryState = {"query": _QUERY}
+    results = await asyncio.gather(
+        agent.search(_QUERY, state), agent.search(_QUERY, state)
+    )
+
+    assert calls == 1
+    assert results[0] == results[1]
+    assert agent._inflight == {}
+
+
 # ═══════════════════════════════════════════════════════════════
 # 2. LinguisticAnalysisAgent
 # ═══════════════════════════════════════════════════════════════
@@ -439,3 +462,95 @@ async def test_discovery_explore_endpoint():
         assert "quality_score" in data
         assert data["verses_count"] > 0
         assert data["science_findings_count"] > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not _has_fastapi, reason="fastapi not installed")
+async def test_discovery_stream_reports_errors(monkeypatch):
+    """A failing graph yields an error frame and still closes the stream."""
+    from httpx import ASGITransport, AsyncClient
+
+    from api.routes import discovery
+    from main import app
+
+    def _broken_graph():
+        raise RuntimeError("graph unavailable")
+
+    monkeypatch.setattr(discovery, "_get_graph", _broken_graph)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        response = await client.post(
+            "/api/discovery/stream",
+            json={"query": _QUERY},
+            timeout=30.0,
+        )
+
+        assert response.status_code == 200
+        body = response.text
+        assert "event: session_start" in body
+        assert "event: error" in body
+        assert "graph unavailable" in body
+        assert "event: complete" not in body
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not _has_fastapi, reason="fastapi not installed")
+async def test_stream_builds_complete_from_updates():
+    """The complete frame comes from the last streamed values, not a checkpointer."""
+    from api.routes import discovery
+
+    class _StreamingGraph:
+        async def astream(self, state, config=None, stream_mode=None):
+            assert stream_mode == ["updates", "values"]
+            yield "values", dict(state)
+            yield "updates", {"quran_rag": {"verses": [{"verse_key": "21:30"}]}}
+            yield "values", {**state, "verses": [{"verse_key": "21:30"}]}
+            yield "updates", {"synthesis": {"synthesis": "نص"}}
+            yield "values", {
+                **state,
+                "verses": [{"verse_key": "21:30"}],
+                "synthesis": "نص",
+                "confidence_tier": "tier_2",
+            }
+
+    frames = [
+        frame
+        async for frame in discovery._stream_from_graph(
+            _StreamingGraph(), {"query": _QUERY}, {}, "s1"
+        )
+    ]
+
+    assert frames[-1].startswith(b"event: complete\n")
+    assert b'"verses_count":1' in frames[-1]
+    assert b'"confidence_tier":"tier_2"' in frames[-1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not _has_fastapi, reason="fastapi not installed")
+@pytest.mark.skipif(
+    importlib.util.find_spec("langgraph") is None, reason="langgraph not installed"
+)
+async def test_cached_graph_keeps_no_sessions():
+    """Sessions served by the shared graph leave no checkpoints behind."""
+    from httpx import ASGITransport, AsyncClient
+
+    from api.routes import discovery
+    from main import app
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        await client.post(
+            "/api/discovery/stream", json={"query": _QUERY}, timeout=30.0
+        )
+        await client.post(
+            "/api/discovery/explore", json={"query": _QUERY}, timeout=30.0
+        )
+
+    graph = discovery._get_graph()
+    saver = graph.checkpointer
+    assert saver is None or not getattr(saver, "storage", {})
@@ -0,0 +1,147 @@
+"""Tests for arabic_nlp.embeddings — no OpenAI calls are made."""
+
+import asyncio
+
+import httpx
+import pytest
+
+pytest.importorskip("openai")
+
+import openai  # noqa: E402
+
+from arabic_nlp import embeddings  # noqa: E402
+
+
+def _api_error(cls: type[openai.APIStatusError], status: int) -> openai.APIStatusError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+    response = httpx.Response(status, request=request)
+    return cls("rejected", response=response, body=None)
+
+
+@pytest.fixture(autouse=True)
+def _no_redis(monkeypatch):
+    """Keep tests independent of any Redis configured in the environment."""
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    monkeypatch.setattr(embeddings, "_redis", None)
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.store.get(key)
+
+    async def setex(self, key: str, ttl: int, value: bytes) -> None:
+        self.store[key] = value
+
+
+@pytest.mark.asyncio
+async def test_concurrent_single_embeddings_are_coalesced(monkeypatch):
+    calls: list[list[str]] = []
+
+    async def fake_batch(texts: list[str]) -> list[list[float]]:
+        calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+    monkeypatch.setattr(embeddings, "compute_embeddings_batch", fake_batch)
+
+    texts = ["ماء", "الأرض", "السماوات"]
+    results = await asyncio.gather(*(embeddings.compute_embeddings(t) for t in texts))
+
+    assert calls == [texts]
+    assert results == [[3.0], [5.0], [8.0]]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_batch_error_only_fails_the_bad_text(monkeypatch):
+    calls: list[list[str]] = []
+
+    async def picky_batch(texts: list[str]) -> list[list[float]]:
+        calls.append(list(texts))
+        if "" in texts:
+            raise _api_error(openai.BadRequestError, 400)
+        return [[float(len(t))] for t in texts]
+
+    monkeypatch.setattr(embeddings, "compute_embeddings_batch", picky_batch)
+
+    good, bad = await asyncio.gather(
+        embeddings.compute_embeddings("ماء"),
+        embeddings.compute_embeddings(""),
+        return_exceptions=True,
+    )
+
+    assert good == [3.0]
+    assert isinstance(bad, openai.BadRequestError)
+    assert calls[0] == ["ماء", ""]
+    assert sorted(calls[1:]) == [[""], ["ماء"]]
+
+
+@pytest.mark.asyncio
+async def test_transient_batch_error_is_not_retried_per_text(monkeypatch):
+    calls: list[list[str]] = []
+
+    async def throttled_batch(texts: list[str]) -> list[list[float]]:
+        calls.append(list(texts))
+        raise _api_error(openai.RateLimitError, 429)
+
+    monkeypatch.setattr(embeddings, "compute_embeddings_batch", throttled_batch)
+
+    results = await asyncio.gather(
+        *(embeddings.compute_embeddings(t) for t in ("أ", "ب", "ج")),
+        return_exceptions=True,
+    )
+
+    assert len(calls) == 1
+    assert all(isinstance(r, openai.RateLimitError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_query_embedding_served_from_redis(monkeypatch):
+    pytest.importorskip("redis")
+    calls: list[list[str]] = []
+
+    async def fake_batch(texts: list[str]) -> list[list[float]]:
+        calls.append(list(texts))
+        return [[0.5, -1.25] for _ in texts]
+
+    monkeypatch.setattr(embeddings, "compute_embeddings_batch", fake_batch)
+    monkeypatch.setattr(embeddings, "_redis", _FakeRedis())
+
+    first = await embeddings.compute_embeddings("الماء ")
+    second = await embeddings.compute_embeddings("الماء")
+
+    assert first == second == [0.5, -1.25]
+    # The cached vector was computed from the same normalized text it is keyed by
+    assert calls == [["الماء"]]
+
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_falls_through_to_api(monkeypatch):
+    pytest.importorskip("redis")
+    from redis.exceptions import TimeoutError as RedisTimeoutError
+
+    class _DeadRedis:
+        async def get(self, key: str) -> bytes | None:
+            raise RedisTimeoutError("Timeout connecting to server")
+
+        async def setex(self, key: str, ttl: int, value: bytes) -> None:
+            raise RedisTimeoutError("Timeout connecting to server")
+
+    async def fake_batch(texts: list[str]) -> list[list[float]]:
+        return [[1.0] for _ in texts]
+
+    monkeypatch.setattr(embeddings, "compute_embeddings_batch", fake_batch)
+    monkeypatch.setattr(embeddings, "_redis", _DeadRedis())
+
+    assert await embeddings.compute_embeddings("الماء") == [1.0]
+
+
+def test_redis_client_has_short_timeouts(monkeypatch):
+    pytest.importorskip("redis")
+    monkeypatch.setenv("REDIS_URL", "redis://cache.invalid:6379")
+
+    kwargs = embeddings._get_redis().connection_pool.connection_kwargs
+
+    assert kwargs["socket_connect_timeout"] == embeddings.CACHE_TIMEOUT
+    assert kwargs["socket_timeout"] == embeddings.CACHE_TIMEOUT
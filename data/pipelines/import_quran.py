@@ -22,13 +22,13 @@ Usage:
 from __future__ import annotations
 
 import asyncio
-import json
+import bisect
 import os
-import re
 import sys
 from pathlib import Path
 
 import httpx
+import orjson
 
 # ── Configuration ──────────────────────────────────────────────────────
 
@@ -61,49 +61,53 @@ _SAJDA_VERSES: dict[tuple[int, int], str] = {
     (53, 62): "recommended", (84, 21): "recommended", (96, 19): "obligatory",
 }
 
+# Source sajda type → verses.sajda_type value; anything else stores NULL
+_SAJDA_TYPE_DB: dict[str | None, str] = {
+    "recommended": "mustahab", "obligatory": "wajib",
+    "mustahab": "mustahab", "wajib": "wajib",
+}
+
 # Juz boundaries — (surah, verse) where each juz starts
-_JUZ_STARTS: list[tuple[int, int]] = [
+_JUZ_STARTS: tuple[tuple[int, int], ...] = (
     (1, 1), (2, 142), (2, 253), (3, 93), (4, 24), (4, 148), (5, 83),
     (6, 111), (7, 88), (8, 41), (9, 93), (11, 6), (12, 53), (15, 1),
     (17, 1), (18, 75), (21, 1), (23, 1), (25, 21), (27, 56), (29, 46),
     (33, 31), (36, 28), (39, 32), (41, 47), (46, 1), (51, 31), (58, 1),
     (66, 1), (67, 1),
-]
+)
 
 # Page boundaries — surah:verse → page (Madina Mushaf)
 # Full mapping loaded from quran-metadata repo or computed at runtime
 
 # Arabic diacritical marks (tashkeel) — comprehensive Unicode ranges
-_DIACRITICS_RE = re.compile(
-    "["
-    "\u0610-\u061A"  # Quran annotation signs
-    "\u064B-\u065F"  # Arabic tashkeel (fathatan..hamza below)
-    "\u0670"         # Superscript alef
-    "\u06D6-\u06DC"  # Quran recitation marks
-    "\u06DF-\u06E4"  # Arabic small high ligatures
-    "\u06E7\u06E8"   # Arabic small high
-    "\u06EA-\u06ED"  # Arabic small low
-    "\u08D3-\u08E1"  # Extended Arabic diacritics
-    "\u08E3-\u08FF"  # Extended Arabic combining marks
-    "\uFE70-\uFE7F"  # Arabic presentation forms
-    "]"
-)
+_DIACRITIC_RANGES: list[tuple[int, int]] = [
+    (0x0610, 0x061A),  # Quran annotation signs
+    (0x064B, 0x065F),  # Arabic tashkeel (fathatan..hamza below)
+    (0x0670, 0x0670),  # Superscript alef
+    (0x06D6, 0x06DC),  # Quran recitation marks
+    (0x06DF, 0x06E4),  # Arabic small high ligatures
+    (0x06E7, 0x06E8),  # Arabic small high
+    (0x06EA, 0x06ED),  # Arabic small low
+    (0x08D3, 0x08E1),  # Extended Arabic diacritics
+    (0x08E3, 0x08FF),  # Extended Arabic combining marks
+    (0xFE70, 0xFE7F),  # Arabic presentation forms
+]
+
+# str.translate table mapping every diacritic code point to deletion
+_DIACRITICS_TABLE: dict[int, None] = {
+    cp: None for first, last in _DIACRITIC_RANGES for cp in range(first, last + 1)
+}
 
 
 def strip_diacritics(text: str) -> str:
     """Remove all Arabic diacritical marks (tashkeel) from text."""
-    return _DIACRITICS_RE.sub("", text)
+    return text.translate(_DIACRITICS_TABLE)
 
 
 def _get_juz(surah: int, verse: int) -> int:
     """Compute juz number for a given surah:verse."""
-    juz = 1
-    for i, (s, v) in enumerate(_JUZ_STARTS):
-        if (surah, verse) >= (s, v):
-            juz = i + 1
-        else:
-            break
-    return juz
+    # _JUZ_STARTS is sorted, so the juz is the number of starts <= (surah, verse)
+    return max(bisect.bisect_right(_JUZ_STARTS, (surah, verse)), 1)
 
 
 # ── HTTP Helper ────────────────────────────────────────────────────────
@@ -120,7 +124,7 @@ async def _get_json(
         try:
             resp = await client.get(url, params=params or {})
             resp.raise_for_status()
-            return resp.json()
+            return orjson.loads(resp.content)
         except (httpx.HTTPStatusError, httpx.TransportError) as exc:
             last_exc = exc
             if attempt < RETRY_ATTEMPTS - 1:
@@ -203,6 +207,19 @@ async def _qf_fetch_verses(
     return verses
 
 
+async def _qf_import_chapter(
+    client: httpx.AsyncClient,
+    chapter: int,
+    semaphore: asyncio.Semaphore,
+) -> list[dict]:
+    """Fetch one chapter and write its JSON file off the event loop."""
+    verses = await _qf_fetch_verses(client, chapter, semaphore)
+    await asyncio.to_thread(
+        _save_json, OUTPUT_DIR / f"surah_{chapter:03d}.json", verses,
+    )
+    return verses
+
+
 async def import_from_api(
     client: httpx.AsyncClient,
 ) -> tuple[dict[int, dict], list[dict], list[str]]:
@@ -217,16 +234,19 @@ async def import_from_api(
 
     print("\n  [API] Downloading verses...\n")
     semaphore = asyncio.Semaphore(QF_CONCURRENT)
-    for ch in range(1, TOTAL_SURAHS + 1):
+    chapters = range(1, TOTAL_SURAHS + 1)
+    results = await asyncio.gather(
+        *(_qf_import_chapter(client, ch, semaphore) for ch in chapters),
+        return_exceptions=True,
+    )
+    for ch, result in zip(chapters, results, strict=True):
         name = surahs_meta.get(ch, {}).get("name_arabic", f"Surah {ch}")
-        try:
-            verses = await _qf_fetch_verses(client, ch, semaphore)
-            all_verses.extend(verses)
-            _save_json(OUTPUT_DIR / f"surah_{ch:03d}.json", verses)
-            print(f"   [{ch:3d}/114] {name} — {len(verses)} verses")
-        except Exception as exc:
-            errors.append(f"Surah {ch} ({name}): {exc}")
-            print(f"   [{ch:3d}/114] {name} — ERROR: {exc}")
+        if isinstance(result, BaseException):
+            errors.append(f"Surah {ch} ({name}): {result}")
+            print(f"   [{ch:3d}/114] {name} — ERROR: {result}")
+        else:
+            all_verses.extend(result)
+            print(f"   [{ch:3d}/114] {name} — {len(result)} verses")
 
     return surahs_meta, all_verses, errors
 
@@ -341,6 +361,13 @@ async def import_from_github(
 
 # ── Database Insertion ─────────────────────────────────────────────────
 
+# Columns written per verse — shared by the staging COPY and the merge
+_VERSE_COLUMNS = [
+    "surah_number", "verse_number", "text_uthmani", "text_simple",
+    "text_clean", "juz", "hizb", "rub_el_hizb", "page_number",
+    "sajda", "sajda_type",
+]
+
 
 async def insert_into_db(
     surahs_meta: dict[int, dict],
@@ -348,6 +375,9 @@ async def insert_into_db(
 ) -> tuple[int, int]:
     """Insert surahs and verses into PostgreSQL via asyncpg.
 
+    Verses are bulk-loaded with COPY into a staging table and merged in a
+    single INSERT ... ON CONFLICT, instead of one round-trip per verse.
+
     Returns (surahs_inserted, verses_inserted).
     """
     import asyncpg
@@ -359,44 +389,69 @@ async def insert_into_db(
     conn = await asyncpg.connect(database_url)
 
     try:
-        surah_count = 0
-        for _num, meta in sorted(surahs_meta.items()):
-            rev_type = "makki" if meta["revelation_type"] == "makkah" else "madani"
-            await conn.execute(
-                """
-                INSERT INTO surahs (number, name_arabic, name_english,
-                                    name_transliteration, revelation_type,
-                                    revelation_order, verse_count)
-                VALUES ($1, $2, $3, $4, $5, $6, $7)
-                ON CONFLICT (number) DO UPDATE SET
-                    name_arabic = EXCLUDED.name_arabic,
-                    name_english = EXCLUDED.name_english,
-                    verse_count = EXCLUDED.verse_count
-                """,
+        # Surahs: one prepared statement, all rows in a single executemany
+        surah_records = [
+            (
                 meta["number"],
                 meta["name_arabic"],
                 meta["name_english"],
                 meta["name_transliteration"],
-                rev_type,
+                "makki" if meta["revelation_type"] == "makkah" else "madani",
                 meta["revelation_order"],
                 meta["verse_count"],
             )
-            surah_count += 1
+            for _num, meta in sorted(surahs_meta.items())
+        ]
+        await conn.executemany(
+            """
+            INSERT INTO surahs (number, name_arabic, name_english,
+                                name_transliteration, revelation_type,
+                                revelation_order, verse_count)
+            VALUES ($1, $2, $3, $4, $5, $6, $7)
+            ON CONFLICT (number) DO UPDATE SET
+                name_arabic = EXCLUDED.name_arabic,
+                name_english = EXCLUDED.name_english,
+                verse_count = EXCLUDED.verse_count
+            """,
+            surah_records,
+        )
+        surah_count = len(surah_records)
 
-        verse_count = 0
+        # Verses: binary COPY into a temp staging table, then one merge
+        records = []
         for v in all_verses:
-            sajda_type_db = None
-            if v["sajda_type"] == "recommended":
-                sajda_type_db = "mustahab"
-            elif v["sajda_type"] == "obligatory":
-                sajda_type_db = "wajib"
+            records.append((
+                v["surah_number"],
+                v["verse_number"],
+                v["text_uthmani"],
+                v["text_simple"],
+                v["text_clean"],
+                v["juz"],
+                v.get("hizb"),
+                v.get("rub_el_hizb"),
+                v["page"],
+                v["sajda"],
+                _SAJDA_TYPE_DB.get(v["sajda_type"]),
+            ))
 
+        async with conn.transaction():
             await conn.execute(
                 """
-                INSERT INTO verses (surah_number, verse_number, text_uthmani,
-                                    text_simple, text_clean, juz, hizb,
-                                    rub_el_hizb, page_number, sajda, sajda_type)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+                CREATE TEMP TABLE verses_stage (
+                    surah_number SMALLINT, verse_number SMALLINT,
+                    text_uthmani TEXT, text_simple TEXT, text_clean TEXT,
+                    juz SMALLINT, hizb SMALLINT, rub_el_hizb SMALLINT,
+                    page_number SMALLINT, sajda BOOLEAN, sajda_type VARCHAR(20)
+                ) ON COMMIT DROP
+                """
+            )
+            await conn.copy_records_to_table(
+                "verses_stage", records=records, columns=_VERSE_COLUMNS,
+            )
+            await conn.execute(
+                f"""
+                INSERT INTO verses ({", ".join(_VERSE_COLUMNS)})
+                SELECT {", ".join(_VERSE_COLUMNS)} FROM verses_stage
                 ON CONFLICT (surah_number, verse_number) DO UPDATE SET
                     text_uthmani = EXCLUDED.text_uthmani,
                     text_simple = EXCLUDED.text_simple,
@@ -405,20 +460,9 @@ async def insert_into_db(
                     page_number = EXCLUDED.page_number,
                     sajda = EXCLUDED.sajda,
                     sajda_type = EXCLUDED.sajda_type
-                """,
-                v["surah_number"],
-                v["verse_number"],
-                v["text_uthmani"],
-                v["text_simple"],
-                v["text_clean"],
-                v["juz"],
-                v.get("hizb"),
-                v.get("rub_el_hizb"),
-                v["page"],
-                v["sajda"],
-                sajda_type_db,
+                """
             )
-            verse_count += 1
+        verse_count = len(records)
 
         return surah_count, verse_count
     finally:
@@ -429,11 +473,8 @@ async def insert_into_db(
 
 
 def _save_json(path: Path, data: object) -> None:
-    """Write JSON file with Arabic-safe encoding."""
-    path.write_text(
-        json.dumps(data, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    """Write JSON file with Arabic-safe encoding (orjson emits raw UTF-8)."""
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 
 def _parse_source_arg() -> str: